@@ -0,0 +1,174 @@
+import hashlib
+import re
+from functools import wraps
+from urllib.parse import urlencode
+
+import redis
+from flask import Response, current_app, request
+
+import config as app_config
+
+
+# --------------------------
+# Redis Cache
+# --------------------------
+class RedisCache:
+    def __init__(self, url=None, max_connections=20):
+        self.client = None
+        if url:
+            pool = redis.ConnectionPool.from_url(url, max_connections=max_connections)
+            self.client = redis.Redis(connection_pool=pool)
+
+    @property
+    def enabled(self):
+        return self.client is not None
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        try:
+            return self.client.get(key)
+        except redis.RedisError:
+            return None
+
+    def set(self, key, value, expire, tag=None):
+        if not self.enabled:
+            return
+        try:
+            if tag is None:
+                self.client.setex(key, expire, value)
+                return
+            # Record the key in its tag set so invalidation never has to SCAN
+            pipe = self.client.pipeline(transaction=False)
+            pipe.setex(key, expire, value)
+            pipe.sadd(tag, key)
+            pipe.expire(tag, expire)
+            pipe.execute()
+        except redis.RedisError:
+            pass
+
+    def invalidate(self, tag):
+        """Drop every entry stored under tag, along with the tag set itself."""
+        if not self.enabled:
+            return
+        try:
+            keys = self.client.smembers(tag)
+            self.client.delete(tag, *keys)
+        except redis.RedisError:
+            pass
+
+
+cache = RedisCache(app_config.REDIS_URL, max_connections=app_config.REDIS_MAX_CONNECTIONS)
+
+# make_response always writes "status" first, so the envelope can be told
+# apart without parsing the body
+_SUCCESS_PREFIX = b'{"status":"success"'
+
+
+def is_success(response):
+    """True for a buffered 200 response carrying a success envelope.
+
+    Several lookups answer "not found" with a 200 error envelope; those must
+    not be cached or tagged.
+    """
+    if response.status_code != 200 or response.is_streamed:
+        return False
+    return response.get_data().startswith(_SUCCESS_PREFIX)
+
+
+def _scope_id(value):
+    # Scope values come from the client; hash them so "*", "[" and the like
+    # never reach a key or tag name verbatim
+    return hashlib.blake2b(value.encode(), digest_size=8).hexdigest()
+
+
+def cache_tag(prefix, value):
+    return f"{prefix}keys:{_scope_id(value)}"
+
+
+def _cache_key(prefix, scope=None):
+    # urlencode re-escapes "&" and "=" inside values, so distinct queries
+    # cannot collapse onto one key
+    args = urlencode(sorted(request.args.items(multi=True)))
+    digest = hashlib.sha1(f"{request.path}?{args}".encode()).hexdigest()
+    if scope:
+        return f"{prefix}:{_scope_id(request.args.get(scope, ''))}:{digest}"
+    return f"{prefix}:{digest}"
+
+
+def cached(prefix, expire, scope=None):
+    """Cache successful JSON responses of a GET view, keyed by path and query args.
+
+    With scope, entries are tagged by the value of that query arg so all of
+    them can be dropped with cache.invalidate(cache_tag(prefix, value)).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not cache.enabled:
+                return view(*args, **kwargs)
+
+            key = _cache_key(prefix, scope)
+            value = cache.get(key)
+            if value is not None:
+                # Stored as b"<etag>\n<body>" so hits skip re-hashing the body
+                etag, sep, raw = value.partition(b"\n")
+                response = Response(raw if sep else etag, mimetype="application/json")
+                if sep:
+                    response.set_etag(etag.decode())
+                return response
+
+            response = current_app.make_response(view(*args, **kwargs))
+            if is_success(response):
+                raw = response.get_data()
+                etag = etag_for(raw)
+                response.set_etag(etag)
+                tag = cache_tag(prefix, request.args.get(scope, "")) if scope else None
+                cache.set(key, etag.encode() + b"\n" + raw, expire, tag=tag)
+            return response
+        return wrapper
+    return decorator
+
+
+# --------------------------
+# Conditional Requests
+# --------------------------
+def etag_for(body):
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+# Flask-Compress tags compressed bodies "<etag>:<algorithm>"; revalidating
+# one of those still refers to the same underlying body
+_ENCODING_SUFFIX = re.compile(r":(?:gzip|br|deflate|zstd)$")
+
+
+def _matching_etag(etag):
+    for tag in request.if_none_match.as_set(include_weak=True):
+        if _ENCODING_SUFFIX.sub("", tag) == etag:
+            return tag
+    return None
+
+
+def conditional(max_age=30):
+    """Tag successful responses with an ETag and answer a matching If-None-Match with 304."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            response = current_app.make_response(view(*args, **kwargs))
+            if not is_success(response):
+                return response
+
+            if "ETag" not in response.headers:
+                response.set_etag(etag_for(response.get_data()))
+            response.cache_control.max_age = max_age
+
+            matched = _matching_etag(response.get_etag()[0])
+            if matched is not None:
+                # Echo the client's tag so it keeps validating its encoded copy
+                not_modified = Response(status=304)
+                not_modified.set_etag(matched)
+                not_modified.cache_control.max_age = max_age
+                return not_modified
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
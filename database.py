@@ -0,0 +1,47 @@
+from pymongo import MongoClient
+
+import config as app_config
+
+# --------------------------
+# MONGO CONNECTION
+# --------------------------
+# One pooled client per process, shared by every handler
+client = MongoClient(
+    app_config.MONGODB_URI,
+    maxPoolSize=app_config.MONGO_MAX_POOL_SIZE,
+    minPoolSize=app_config.MONGO_MIN_POOL_SIZE,
+    retryWrites=True,
+    tlsAllowInvalidCertificates=True
+)
+db = client[app_config.MONGODB_DB_NAME]
+
+fund_holdings = db["fund_holdings_test"]
+stocks = db["stocks"]
+stock_timelines = db["stock_timelines"]
+favorites = db["favorites"]
+users = db["users"]
+
+
+# Case-insensitive comparison for stock names; queries must pass the same
+# collation for Mongo to use the matching index
+NAME_COLLATION = {"locale": "en", "strength": 2}
+
+
+def ensure_indexes():
+    # Indexes for favorites
+    favorites.create_index([("userId", 1), ("itemType", 1)])
+    favorites.create_index([("userId", 1), ("itemId", 1), ("itemType", 1)], unique=True)
+
+    # Indexes for funds: latest-date lookup / date filter, and per-fund history
+    fund_holdings.create_index([("date", -1)])
+    fund_holdings.create_index([("unique_id", 1), ("date", -1)])
+
+    # Indexes for stocks and users
+    stocks.create_index([("name", 1)])
+    # Case-insensitive copy for the ?prefix= autocomplete range scan
+    stocks.create_index([("name", 1)], name="name_ci", collation=NAME_COLLATION)
+    # Only one text index is allowed per collection; replace the name-only one
+    if "name_text" in stocks.index_information():
+        stocks.drop_index("name_text")
+    stocks.create_index([("name", "text"), ("symbol", "text")])
+    users.create_index([("email", 1)], unique=True)
@@ -0,0 +1,17 @@
+import multiprocessing
+import os
+
+# Handlers are Mongo-I/O bound: gevent workers multiplex many in-flight
+# requests per process. The gevent worker monkey-patches the stdlib itself
+# before the app is imported, which pymongo picks up transparently.
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() + 1))
+worker_class = "gevent"
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+# MongoClient is not fork-safe: workers import the app (and create their
+# client in database.py) after forking rather than inheriting the master's.
+preload_app = False
+
+# Indexes are created once per deploy (see Procfile), not by every worker
+raw_env = ["RUN_INDEX_SETUP=0"]
@@ -0,0 +1,179 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock
+import mongomock
+
+# Add parent directory to path to import app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Mock pymongo before importing app
+mock_pymongo = MagicMock()
+mock_pymongo.MongoClient = mongomock.MongoClient
+sys.modules['pymongo'] = mock_pymongo
+
+# Keep mongomock off the SRV lookup of the production URI
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+
+# Import app - this will use the mocked MongoClient
+from app import app, cache, favorites, fund_holdings
+from cache import _cache_key, cache_tag
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis client calls RedisCache makes."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, expire, value):
+        self.store[key] = value
+
+    def sadd(self, key, *members):
+        self.store.setdefault(key, set()).update(members)
+
+    def smembers(self, key):
+        return set(self.store.get(key, set()))
+
+    def expire(self, key, expire):
+        pass
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        return lambda *args: self.calls.append((method, args))
+
+    def execute(self):
+        return [method(*args) for method, args in self.calls]
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.client = app.test_client()
+        self.redis = FakeRedis()
+        cache.client = self.redis
+        favorites.delete_many({})
+        fund_holdings.delete_many({})
+
+        self.user_id = "user_123"
+        favorites.insert_one({
+            "userId": self.user_id,
+            "itemId": "fund_001",
+            "itemType": "fund",
+            "itemName": "Test Fund"
+        })
+
+    def tearDown(self):
+        cache.client = None
+
+    def _keys(self, prefix):
+        return [k for k in self.redis.store if k.startswith(prefix)]
+
+    def _user_entries(self, user_id):
+        # Live entries recorded in the user's favs tag set
+        tagged = self.redis.store.get(cache_tag("favs", user_id), set())
+        return [k for k in tagged if k in self.redis.store]
+
+    def test_get_favorites_served_from_cache(self):
+        print("\nTesting Get Favorites Served From Cache...")
+        first = self.client.get(f'/api/favorites?userId={self.user_id}')
+        keys = self._user_entries(self.user_id)
+        self.assertEqual(len(keys), 1)
+
+        # Stored as b"<etag>\n<body>", with the etag echoed on the response
+        etag, _, body = self.redis.store[keys[0]].partition(b"\n")
+        self.assertEqual(body, first.data)
+        self.assertEqual(first.headers.get('ETag'), f'"{etag.decode()}"')
+
+        favorites.delete_many({})
+        second = self.client.get(f'/api/favorites?userId={self.user_id}')
+        data = second.get_json()
+
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.headers.get('ETag'), first.headers.get('ETag'))
+        self.assertEqual(data['data']['funds'][0]['id'], 'fund_001')
+        print("Get Favorites Served From Cache Passed")
+
+    def test_add_favorite_invalidates_user_entries(self):
+        print("\nTesting Add Favorite Invalidates Cache...")
+        self.client.get(f'/api/favorites?userId={self.user_id}')
+        self.client.get('/api/favorites?userId=other_user')
+
+        payload = {"userId": self.user_id, "itemId": "fund_002", "itemType": "fund", "itemName": "Other Fund"}
+        self.client.post('/api/favorites', json=payload)
+
+        self.assertEqual(self._user_entries(self.user_id), [])
+        self.assertNotIn(cache_tag("favs", self.user_id), self.redis.store)
+        self.assertEqual(len(self._user_entries("other_user")), 1)
+
+        data = self.client.get(f'/api/favorites?userId={self.user_id}').get_json()
+        self.assertEqual(data['count'], 2)
+        print("Add Favorite Invalidates Cache Passed")
+
+    def test_remove_favorite_invalidates_user_entries(self):
+        print("\nTesting Remove Favorite Invalidates Cache...")
+        self.client.get(f'/api/favorites?userId={self.user_id}')
+        self.assertEqual(len(self._user_entries(self.user_id)), 1)
+        self.client.delete(f'/api/favorites/fund_001?userId={self.user_id}&type=fund')
+        self.assertEqual(self._user_entries(self.user_id), [])
+
+        favorites.insert_one({"userId": self.user_id, "itemId": "fund_001", "itemType": "fund"})
+        self.client.get(f'/api/favorites?userId={self.user_id}')
+        self.assertEqual(len(self._user_entries(self.user_id)), 1)
+        payload = {"userId": self.user_id, "itemId": "fund_001", "itemType": "fund"}
+        self.client.post('/api/favorites/rpc/remove', json=payload)
+        self.assertEqual(self._user_entries(self.user_id), [])
+        print("Remove Favorite Invalidates Cache Passed")
+
+    def test_glob_characters_in_user_id_stay_scoped(self):
+        print("\nTesting Glob Characters In userId...")
+        favorites.insert_one({"userId": "[ab]", "itemId": "fund_001", "itemType": "fund"})
+        self.client.get('/api/favorites?userId=%5Bab%5D')
+        self.client.get(f'/api/favorites?userId={self.user_id}')
+
+        payload = {"userId": "[ab]", "itemId": "fund_002", "itemType": "fund"}
+        self.client.post('/api/favorites', json=payload)
+        self.assertEqual(self._user_entries("[ab]"), [])
+        self.assertEqual(len(self._user_entries(self.user_id)), 1)
+
+        payload = {"userId": "*", "itemId": "fund_002", "itemType": "fund"}
+        self.client.post('/api/favorites', json=payload)
+        self.assertEqual(len(self._user_entries(self.user_id)), 1)
+        print("Glob Characters In userId Passed")
+
+    def test_cache_key_escapes_query_values(self):
+        print("\nTesting Cache Key Escapes Query Values...")
+        with app.test_request_context('/getAllFunds?date=2024-01-31%26order%3Dasc'):
+            smuggled = _cache_key("funds")
+        with app.test_request_context('/getAllFunds?date=2024-01-31&order=asc'):
+            plain = _cache_key("funds")
+
+        self.assertNotEqual(smuggled, plain)
+        print("Cache Key Escapes Query Values Passed")
+
+    def test_error_envelope_not_cached(self):
+        print("\nTesting Error Envelope Not Cached...")
+        response = self.client.get('/getFundInfo?fund_id=missing')
+        data = response.get_json()
+
+        self.assertEqual(data['message'], 'Fund not found')
+        self.assertEqual(self._keys("fund_info:"), [])
+        print("Error Envelope Not Cached Passed")
+
+if __name__ == '__main__':
+    unittest.main()
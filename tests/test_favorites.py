@@ -13,6 +13,9 @@ mock_pymongo = MagicMock()
 mock_pymongo.MongoClient = mongomock.MongoClient
 sys.modules['pymongo'] = mock_pymongo
 
+# Keep mongomock off the SRV lookup of the production URI
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+
 # Verify bson import works or is available
 try:
     import bson
@@ -91,6 +94,40 @@ class TestFavorites(unittest.TestCase):
         self.assertEqual(data['records'][0]['_id'], self.stock_id)
         print("Get Favorite Stocks Passed")
 
+    def test_get_favorite_stocks_mixed_ids(self):
+        print("\nTesting Get Favorite Stocks Mixed Ids...")
+        stocks.insert_one({"_id": "legacy_stock", "name": "Legacy Stock", "symbol": "LEG"})
+        favorites.insert_many([
+            {"userId": self.user_id, "itemId": self.stock_id, "itemType": "stock"},
+            {"userId": self.user_id, "itemId": "legacy_stock", "itemType": "stock"}
+        ])
+
+        response = self.client.get(f'/api/favorites/stocks?userId={self.user_id}')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual([r['_id'] for r in data['records']], [self.stock_id, "legacy_stock"])
+        print("Get Favorite Stocks Mixed Ids Passed")
+
+    def test_get_favorite_funds(self):
+        print("\nTesting Get Favorite Funds...")
+        fund_holdings.insert_one({"unique_id": "fund_001", "name": "Test Fund", "date": "2024-01-31"})
+        fund_holdings.insert_one({"unique_id": "fund_002", "name": "Other Fund", "date": "2024-01-31"})
+        favorites.insert_one({
+            "userId": self.user_id,
+            "itemId": "fund_001",
+            "itemType": "fund"
+        })
+
+        response = self.client.get(f'/api/favorites/funds?userId={self.user_id}')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(data['count'], 1)
+        self.assertEqual(data['records'][0]['unique_id'], 'fund_001')
+        print("Get Favorite Funds Passed")
+
     def test_remove_favorite(self):
         print("\nTesting Remove Favorite...")
         # Add favorite
@@ -143,9 +180,27 @@ class TestFavorites(unittest.TestCase):
         stocks_list = data['data']['stocks']
         self.assertEqual(len(stocks_list), 1)
         self.assertEqual(stocks_list[0]['id'], self.stock_id)
-        self.assertEqual(stocks_list[0]['name'], "Test Stock Name")
+        # Current name from the stocks collection wins over the itemName snapshot
+        self.assertEqual(stocks_list[0]['name'], "Test Stock")
         print("Get Favorites Generic Passed")
 
+    def test_get_favorites_keeps_snapshot_name(self):
+        print("\nTesting Get Favorites Snapshot Name...")
+        favorites.insert_one({
+            "userId": self.user_id,
+            "itemId": "fund_missing",
+            "itemType": "fund",
+            "itemName": "Delisted Fund"
+        })
+
+        response = self.client.get(f'/api/favorites?userId={self.user_id}')
+        data = response.get_json()
+
+        funds_list = data['data']['funds']
+        self.assertEqual(len(funds_list), 1)
+        self.assertEqual(funds_list[0]['name'], "Delisted Fund")
+        print("Get Favorites Snapshot Name Passed")
+
     def test_add_favorite_explicit(self):
         print("\nTesting Add Favorite Explicit (RPC)...")
         payload = {
@@ -0,0 +1,85 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock
+import mongomock
+
+# Add parent directory to path to import app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Mock pymongo before importing app
+mock_pymongo = MagicMock()
+mock_pymongo.MongoClient = mongomock.MongoClient
+sys.modules['pymongo'] = mock_pymongo
+
+# Keep mongomock off the SRV lookup of the production URI
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+
+# Import app - this will use the mocked MongoClient
+from app import app, fund_holdings, _latest_date_cache
+
+class TestFunds(unittest.TestCase):
+    def setUp(self):
+        self.client = app.test_client()
+        fund_holdings.delete_many({})
+        _latest_date_cache["expires"] = 0.0
+
+        # Setup test data: two snapshots of one fund
+        self.fund_id = "fund_001"
+        fund_holdings.insert_many([
+            {"unique_id": self.fund_id, "name": "Test Fund", "date": "2024-01-31",
+             "holding_count": 40, "added_count": 2, "removed_count": 1},
+            {"unique_id": self.fund_id, "name": "Test Fund", "date": "2024-02-29",
+             "holding_count": 42, "added_count": 3, "removed_count": 1},
+        ])
+
+    def test_get_all_funds_defaults_to_latest_date(self):
+        print("\nTesting Get All Funds Latest Date...")
+        response = self.client.get('/getAllFunds')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(len(data['records']), 1)
+        self.assertEqual(data['records'][0]['latest_date'], '2024-02-29')
+        self.assertEqual(data['records'][0]['holding_count'], 42)
+        self.assertEqual(data['count'], 1)
+        print("Get All Funds Latest Date Passed")
+
+    def test_get_fund_info(self):
+        print("\nTesting Get Fund Info...")
+        response = self.client.get(f'/getFundInfo?fund_id={self.fund_id}')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(data['records']['date'], '2024-02-29')
+        self.assertEqual(data['records']['holding_count'], 42)
+        self.assertCountEqual(data['records']['fund_count'], [
+            {"date": "2024-01-31", "holding_count": 40},
+            {"date": "2024-02-29", "holding_count": 42},
+        ])
+        print("Get Fund Info Passed")
+
+    def test_get_fund_info_not_found(self):
+        print("\nTesting Get Fund Info Not Found...")
+        response = self.client.get('/getFundInfo?fund_id=missing')
+        data = response.get_json()
+
+        self.assertEqual(data['status'], 'error')
+        self.assertEqual(data['message'], 'Fund not found')
+        print("Get Fund Info Not Found Passed")
+
+    def test_get_all_funds_cache_headers(self):
+        print("\nTesting Get All Funds Cache Headers...")
+        response = self.client.get('/getAllFunds', headers={'Accept-Encoding': 'gzip'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.cache_control.public)
+        self.assertEqual(response.cache_control.max_age, 30)
+        self.assertIn('Origin', response.vary)
+        self.assertIn('Accept-Encoding', response.vary)
+        print("Get All Funds Cache Headers Passed")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock, patch
+import mongomock
+from bson import ObjectId
+
+# Add parent directory to path to import app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Mock pymongo before importing app
+mock_pymongo = MagicMock()
+mock_pymongo.MongoClient = mongomock.MongoClient
+sys.modules['pymongo'] = mock_pymongo
+
+# Keep mongomock off the SRV lookup of the production URI
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+
+# Import app - this will use the mocked MongoClient
+from app import app, stocks, stock_timelines, _stock_cache, _timeline_cache
+
+class TestStocks(unittest.TestCase):
+    def setUp(self):
+        self.client = app.test_client()
+        stocks.delete_many({})
+        stock_timelines.delete_many({})
+        _stock_cache.clear()
+        _timeline_cache.clear()
+
+        # Setup test data
+        self.stock_id = str(stocks.insert_one({"name": "Test Stock", "symbol": "TEST"}).inserted_id)
+        stock_timelines.insert_one({"_id": self.stock_id, "timeline": [{"date": "2024-01-31", "funds": 3}]})
+
+    def test_get_stock_info(self):
+        print("\nTesting Get Stock Info...")
+        response = self.client.get(f'/getStockInfo?stock_id={self.stock_id}')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(data['records']['_id'], self.stock_id)
+        self.assertEqual(data['records']['symbol'], 'TEST')
+        print("Get Stock Info Passed")
+
+    def test_get_stock_info_served_from_local_cache(self):
+        print("\nTesting Get Stock Info Local Cache...")
+        self.client.get(f'/getStockInfo?stock_id={self.stock_id}')
+        stocks.delete_many({})
+
+        response = self.client.get(f'/getStockInfo?stock_id={self.stock_id}')
+        data = response.get_json()
+
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(data['records']['name'], 'Test Stock')
+        print("Get Stock Info Local Cache Passed")
+
+    def test_get_stock_info_not_modified(self):
+        print("\nTesting Get Stock Info Not Modified...")
+        first = self.client.get(f'/getStockInfo?stock_id={self.stock_id}')
+        etag = first.headers.get('ETag')
+        self.assertIsNotNone(etag)
+
+        response = self.client.get(f'/getStockInfo?stock_id={self.stock_id}', headers={'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        self.assertTrue(response.cache_control.public)
+        print("Get Stock Info Not Modified Passed")
+
+    def test_get_all_stocks_gzip_not_modified(self):
+        print("\nTesting Get All Stocks Gzip Not Modified...")
+        stocks.insert_many([{"name": f"Stock {i}", "symbol": f"S{i}", "sector": "Energy"} for i in range(50)])
+        first = self.client.get('/getAllStocks', headers={'Accept-Encoding': 'gzip'})
+        etag = first.headers.get('ETag')
+        self.assertEqual(first.headers.get('Content-Encoding'), 'gzip')
+        self.assertTrue(etag.endswith(':gzip"'))
+
+        with patch('flask_compress.flask_compress._compress_data') as compress:
+            response = self.client.get('/getAllStocks', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers.get('ETag'), etag)
+        compress.assert_not_called()
+        print("Get All Stocks Gzip Not Modified Passed")
+
+    def test_get_stock_info_not_found_not_tagged(self):
+        print("\nTesting Get Stock Info Not Found Not Tagged...")
+        response = self.client.get(f'/getStockInfo?stock_id={ObjectId()}')
+        data = response.get_json()
+
+        self.assertEqual(data['message'], 'Stock not found')
+        self.assertIsNone(response.headers.get('ETag'))
+        self.assertFalse(response.cache_control.public)
+        self.assertIsNone(response.cache_control.max_age)
+        print("Get Stock Info Not Found Not Tagged Passed")
+
+    def test_get_stock_timeline(self):
+        print("\nTesting Get Stock Timeline...")
+        response = self.client.get(f'/getStockTimeline?stock_id={self.stock_id}')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(data['records']['timeline'][0]['funds'], 3)
+        print("Get Stock Timeline Passed")
+
+    def test_get_all_stocks_fields(self):
+        print("\nTesting Get All Stocks Fields...")
+        response = self.client.get('/getAllStocks?fields=symbol')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['records'][0]['symbol'], 'TEST')
+        self.assertNotIn('name', data['records'][0])
+        print("Get All Stocks Fields Passed")
+
+    def test_get_all_stocks_rejects_bad_fields(self):
+        print("\nTesting Get All Stocks Bad Fields...")
+        response = self.client.get('/getAllStocks?fields=name,name.first')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['status'], 'error')
+        print("Get All Stocks Bad Fields Passed")
+
+    def test_get_all_stocks_rejects_bad_query(self):
+        print("\nTesting Get All Stocks Bad Query...")
+        response = self.client.get('/getAllStocks?limit=abc&order=bogus')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['status'], 'error')
+        self.assertIn('limit', data['data'])
+        self.assertIn('order', data['data'])
+        print("Get All Stocks Bad Query Passed")
+
+    def test_get_all_stocks_clamps_paging(self):
+        print("\nTesting Get All Stocks Clamps Paging...")
+        response = self.client.get('/getAllStocks?limit=5000&skip=-1')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['records']), 1)
+        print("Get All Stocks Clamps Paging Passed")
+
+    def test_get_all_stocks_ignores_unknown_sort(self):
+        print("\nTesting Get All Stocks Unknown Sort...")
+        stocks.insert_one({"name": "Another Stock", "symbol": "ANOT", "secret": 1})
+        response = self.client.get('/getAllStocks?sort_by=secret&order=desc')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r['name'] for r in data['records']], ['Test Stock', 'Another Stock'])
+        print("Get All Stocks Unknown Sort Passed")
+
+    def test_get_all_stocks_search(self):
+        print("\nTesting Get All Stocks Search...")
+        # mongomock has no $text support, so stand in for the aggregate
+        result = {"records": [{"_id": "s1", "name": "Tata Motors", "symbol": "TATAMOTORS"}], "count": [{"n": 7}]}
+        with patch.object(stocks, "aggregate", return_value=iter([result])) as aggregate:
+            response = self.client.get('/getAllStocks?search=tata&skip=10&limit=5')
+        data = response.get_json()
+
+        pipeline = aggregate.call_args[0][0]
+        self.assertEqual(pipeline[0], {"$match": {"$text": {"$search": "tata"}}})
+        self.assertEqual(pipeline[1]["$facet"]["records"], [
+            {"$sort": {"score": {"$meta": "textScore"}}},
+            {"$skip": 10},
+            {"$limit": 5},
+            {"$project": {"name": 1, "symbol": 1, "sector": 1}}
+        ])
+        self.assertEqual(pipeline[1]["$facet"]["count"], [{"$count": "n"}])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['count'], 7)
+        self.assertEqual(data['records'][0]['name'], 'Tata Motors')
+        print("Get All Stocks Search Passed")
+
+    def test_get_all_stocks_search_sorted_no_match(self):
+        print("\nTesting Get All Stocks Search Sorted No Match...")
+        result = {"records": [], "count": []}
+        with patch.object(stocks, "aggregate", return_value=iter([result])) as aggregate:
+            response = self.client.get('/getAllStocks?search=zzz&sort_by=symbol&order=desc')
+        data = response.get_json()
+
+        pipeline = aggregate.call_args[0][0]
+        self.assertEqual(pipeline[1]["$facet"]["records"][0], {"$sort": {"symbol": -1}})
+        self.assertEqual(data['count'], 0)
+        self.assertEqual(data['records'], [])
+        print("Get All Stocks Search Sorted No Match Passed")
+
+    def test_get_all_stocks_prefix(self):
+        print("\nTesting Get All Stocks Prefix...")
+        stocks.insert_one({"name": "Tata Motors", "symbol": "TATAMOTORS"})
+        stocks.insert_one({"name": "Infosys", "symbol": "INFY"})
+        response = self.client.get('/getAllStocks?prefix=T')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['count'], 2)
+        self.assertEqual([r['name'] for r in data['records']], ['Tata Motors', 'Test Stock'])
+        print("Get All Stocks Prefix Passed")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock, patch
+import mongomock
+
+# Add parent directory to path to import app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Mock pymongo before importing app
+mock_pymongo = MagicMock()
+mock_pymongo.MongoClient = mongomock.MongoClient
+sys.modules['pymongo'] = mock_pymongo
+
+# Keep mongomock off the SRV lookup of the production URI
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+
+# Import app - this will use the mocked MongoClient
+from app import app, users
+
+class TestUsers(unittest.TestCase):
+    def setUp(self):
+        self.client = app.test_client()
+        users.delete_many({})
+
+        users.insert_many([
+            {"name": f"User {i}", "email": f"user{i}@example.com"}
+            for i in range(5)
+        ])
+
+    def test_create_user(self):
+        print("\nTesting Create User...")
+        payload = {"name": "New User", "email": "new@example.com"}
+        response = self.client.post('/api/users', json=payload)
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(data['message'], 'User created')
+        self.assertEqual(data['data']['email'], 'new@example.com')
+
+        # Verify in DB
+        user = users.find_one({"email": "new@example.com"})
+        self.assertIsNotNone(user)
+        self.assertEqual(str(user['_id']), data['data']['_id'])
+        print("Create User Passed")
+
+    def test_create_existing_user(self):
+        print("\nTesting Create Existing User...")
+        payload = {"name": "Renamed", "email": "user0@example.com"}
+        response = self.client.post('/api/users', json=payload)
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['message'], 'User already exists')
+        self.assertEqual(data['data']['name'], 'User 0')
+        self.assertEqual(users.count_documents({"email": "user0@example.com"}), 1)
+        print("Create Existing User Passed")
+
+    def test_list_users_paginated(self):
+        print("\nTesting List Users Paginated...")
+        response = self.client.get('/api/users/all?skip=1&limit=2')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(len(data['records']), 2)
+        self.assertEqual(data['records'][0]['email'], 'user1@example.com')
+        self.assertEqual(data['count'], 5)
+        print("List Users Paginated Passed")
+
+    def test_list_users_limit_capped(self):
+        print("\nTesting List Users Limit Capped...")
+        users.insert_many([
+            {"name": f"Extra {i}", "email": f"extra{i}@example.com"}
+            for i in range(600)
+        ])
+
+        response = self.client.get('/api/users/all?limit=10000')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['records']), 500)
+        self.assertEqual(data['count'], 605)
+        print("List Users Limit Capped Passed")
+
+    def test_list_users_bad_paging(self):
+        print("\nTesting List Users Bad Paging...")
+        response = self.client.get('/api/users/all?limit=abc')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['status'], 'error')
+        print("List Users Bad Paging Passed")
+
+    def test_get_user_invalid_id(self):
+        print("\nTesting Get User Invalid Id...")
+        response = self.client.get('/api/users/not-an-object-id')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['status'], 'error')
+        print("Get User Invalid Id Passed")
+
+    def test_update_user_duplicate_email(self):
+        print("\nTesting Update User Duplicate Email...")
+        user_id = str(users.find_one({"email": "user0@example.com"})["_id"])
+        response = self.client.put(f'/api/users/{user_id}', json={"email": "user1@example.com"})
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(data['status'], 'error')
+        self.assertNotIn('E11000', data['message'])
+        print("Update User Duplicate Email Passed")
+
+    def test_update_user_rejects_reserved_fields(self):
+        print("\nTesting Update User Reserved Fields...")
+        user_id = str(users.find_one({"email": "user0@example.com"})["_id"])
+        response = self.client.put(f'/api/users/{user_id}', json={"_id": "x", "$unset": {}, "createdAt": 0})
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertCountEqual(data['data'].keys(), ['_id', '$unset', 'createdAt'])
+        print("Update User Reserved Fields Passed")
+
+    def test_list_users_query_error(self):
+        print("\nTesting List Users Query Error...")
+        from pymongo.errors import ExecutionTimeout
+
+        def failing_cursor():
+            raise ExecutionTimeout("operation exceeded time limit")
+            yield
+
+        cursor = MagicMock()
+        cursor.skip.return_value.limit.return_value.batch_size.return_value = failing_cursor()
+        with patch.object(users, "find", return_value=cursor):
+            response = self.client.get('/api/users/all')
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(data['status'], 'error')
+        print("List Users Query Error Passed")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+from marshmallow import EXCLUDE, INCLUDE, Schema, ValidationError, fields, validate, validates_schema
+
+
+# --------------------------
+# Schemas
+# --------------------------
+class CreateUserSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    name = fields.String(required=True, validate=validate.Length(min=1))
+    email = fields.String(required=True, validate=validate.Length(min=1))
+    picture = fields.Raw(load_default=None, allow_none=True)
+    phoneNumber = fields.Raw(load_default=None, allow_none=True)
+
+
+class UpdateUserSchema(Schema):
+    class Meta:
+        unknown = INCLUDE
+
+    name = fields.String(validate=validate.Length(min=1))
+    email = fields.String(validate=validate.Length(min=1))
+
+    # Extra profile fields pass through to $set, but never server-managed
+    # ones or keys Mongo would read as operators / nested paths
+    _RESERVED = frozenset({"_id", "createdAt", "updatedAt"})
+
+    @validates_schema
+    def reject_reserved_keys(self, data, **kwargs):
+        errors = {
+            key: ["Field cannot be updated."]
+            for key in data
+            if key in self._RESERVED or key.startswith("$") or "." in key
+        }
+        if errors:
+            raise ValidationError(errors)
+
+
+class AddFavoriteSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    userId = fields.String(required=True, validate=validate.Length(min=1))
+    itemId = fields.String(required=True, validate=validate.Length(min=1))
+    itemType = fields.String(required=True, validate=validate.Length(min=1))
+    itemName = fields.String(load_default="", allow_none=True)
+
+
+class RemoveFavoriteSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    userId = fields.String(required=True, validate=validate.Length(min=1))
+    itemId = fields.String(required=True, validate=validate.Length(min=1))
+    itemType = fields.String(required=True, validate=validate.Length(min=1))
+
+
+class StockQuerySchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    # Out-of-range paging is clamped by the view, as on the other list endpoints
+    skip = fields.Integer(load_default=0)
+    limit = fields.Integer(load_default=50)
+    sort_by = fields.String(load_default=None)
+    order = fields.String(load_default="asc", validate=validate.OneOf(["asc", "desc"]))
+    search = fields.String(load_default="")
+    prefix = fields.String(load_default="")
+
+
+# Schemas are built once at import and shared across requests
+_SCHEMAS = {
+    CreateUserSchema: CreateUserSchema(),
+    UpdateUserSchema: UpdateUserSchema(),
+    AddFavoriteSchema: AddFavoriteSchema(),
+    RemoveFavoriteSchema: RemoveFavoriteSchema(),
+    StockQuerySchema: StockQuerySchema(),
+}
+
+
+def validate_request_data(schema_cls, data):
+    """Load data with the prebuilt instance of schema_cls; returns (validated, errors)."""
+    try:
+        return _SCHEMAS[schema_cls].load(data if data is not None else {}), None
+    except ValidationError as e:
+        return None, e.messages